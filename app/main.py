@@ -1,32 +1,55 @@
 from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from starlette.types import Scope
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache assets between page loads.
+
+    ETag/If-None-Match revalidation (304) is already handled by StaticFiles.
+    """
+
+    def __init__(self, *args, max_age: int = 86400, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_control = f"public, max-age={max_age}"
+
+    async def get_response(self, path: str, scope: Scope):
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = self.cache_control
+        return response
 
 
 app = FastAPI()
 
-app.mount("/static", StaticFiles(directory="static"), name="static")
+app.mount("/static", CachedStaticFiles(directory="static"), name="static")
 
 templates = Jinja2Templates(directory="templates")
 
+# Resolve templates once instead of going through the loader per request
+home_template = templates.get_template("home.html")
+profile_template = templates.get_template("profile.html")
+
 
 @app.get("/")
-def home(request: Request):
-    return templates.TemplateResponse("home.html", {
-        "request": request,
-        "message": "Hello, World!"
-    })
+async def home(request: Request):
+    return HTMLResponse(home_template.render(
+        request=request,
+        message="Hello, World!"
+    ))
 
 
 @app.get("/profile")
-def profile(request: Request):
+async def profile(request: Request):
 
     # Get relevant data from database
     upcouming_events = range(5)
     current_username = "Chuck Norris"
 
-    return templates.TemplateResponse("profile.html", {
-        "request": request,
-        "username": current_username,
-        "events": upcouming_events
-    })
+    return HTMLResponse(profile_template.render(
+        request=request,
+        username=current_username,
+        events=upcouming_events
+    ))